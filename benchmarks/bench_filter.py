@@ -0,0 +1,72 @@
+"""
+Compare filter_telugu with filter_telugu_batch on synthetic archives.
+
+Usage:
+  python benchmarks/bench_filter.py [--lines N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from scraper import filter_telugu, filter_telugu_batch  # noqa: E402
+
+TELUGU_WORDS = [
+    "ప్రభుత్వం", "ముఖ్యమంత్రి", "హైదరాబాద్", "రాష్ట్రంలో", "ప్రజలు", "ఎన్నికలు", "సమావేశం",
+    "నిర్ణయం", "అధికారులు", "వర్షాలు", "రైతులు", "పథకం", "కేంద్రం", "మంత్రి", "తెలిపారు",
+]
+ENGLISH_WORDS = ["Andhra", "Pradesh", "news", "live", "video", "share", "minister", "said", "today", "AP"]
+NUMBERS = ["2024", "15", "₹500", "26/08/2025", "50-17-64", "3.5"]
+
+
+def telugu_line(rng: random.Random, with_digits: bool) -> str:
+    words = rng.choices(TELUGU_WORDS, k=rng.randint(4, 14))
+    if with_digits and rng.random() < 0.3:
+        words.insert(rng.randrange(len(words)), rng.choice(NUMBERS))
+    if rng.random() < 0.2:
+        words.insert(rng.randrange(len(words)), rng.choice(ENGLISH_WORDS))
+    return " ".join(words) + "."
+
+
+def english_line(rng: random.Random) -> str:
+    return " ".join(rng.choices(ENGLISH_WORDS, k=rng.randint(4, 14))) + "."
+
+
+def corpora(n: int) -> dict[str, list[str]]:
+    rng = random.Random(0)
+    return {
+        "telugu, no digits": [telugu_line(rng, False) for _ in range(n)],
+        "telugu news (numbers/addresses)": [telugu_line(rng, True) for _ in range(n)],
+        "50/50 english/telugu": [
+            telugu_line(rng, True) if rng.random() < 0.5 else english_line(rng) for _ in range(n)
+        ],
+    }
+
+
+def timed(fn, lines: list[str]) -> tuple[float, list[str]]:
+    t0 = time.perf_counter()
+    out = fn(lines)
+    return time.perf_counter() - t0, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs batch line filtering")
+    parser.add_argument("--lines", type=int, default=200_000, help="Lines per corpus")
+    args = parser.parse_args()
+
+    for name, lines in corpora(args.lines).items():
+        t_scalar, out_scalar = timed(filter_telugu, lines)
+        t_batch, out_batch = timed(filter_telugu_batch, lines)
+        same = "same" if out_scalar == out_batch else "DIFFERENT"
+        print(
+            f"{name:34s} scalar {t_scalar:6.2f}s  batch {t_batch:6.2f}s  "
+            f"x{t_scalar / t_batch:4.1f}  ({len(out_scalar)} lines kept, output {same})"
+        )
+
+
+if __name__ == "__main__":
+    main()
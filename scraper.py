@@ -570,15 +570,32 @@ Usage:
 """
 
 import argparse
+import hashlib
+import html as htmllib
+import random
 import re
 import sys
-from collections import OrderedDict
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import accumulate, islice
+from typing import Optional
 import os
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urldefrag, urljoin, urlparse
 
 import requests
+import urllib3
 from bs4 import BeautifulSoup
 
+try:
+    import numpy as np
+except ImportError:  # only filter_telugu_batch needs it, and it raises without numpy
+    np = None
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -594,10 +611,294 @@ CLEAN_RE = re.compile(fr"[^ {TELUGU_RANGE}0-9A-Za-z\s\.,!\?;:\(\)\"'\-\/\u2013\u
 MULTISPACE_RE = re.compile(r"\s+")
 ui_words_re = re.compile(r"\b(click|download|pdf|live\s*updates?)\b", re.I)
 
-
-def fetch(url: str) -> str:
-    resp = requests.get(url, headers=HEADERS, timeout=20)
-    resp.raise_for_status()
+# Raw-byte pre-screen: U+0C00–U+0C7F is E0 B0 80 – E0 B1 BF in UTF-8
+PRESCREEN_SAMPLE_BYTES = 256 * 1024
+# Fewer visible chars than this in the sample marks a near-empty shell
+PRESCREEN_MIN_VISIBLE_CHARS = 200
+# Off by default; pages are only skipped when --min-telugu-density is given
+DEFAULT_MIN_TELUGU_DENSITY = 0.0
+TELUGU_UTF8_RE = re.compile(rb"\xe0[\xb0\xb1][\x80-\xbf]")
+# Where the sample starts: the first <article>, else <body>
+CONTENT_START_RES = [re.compile(rb"<article\b", re.I), re.compile(rb"<body\b", re.I)]
+# Script/style/comments and tags (possibly cut off at the sample boundary)
+INVISIBLE_BYTES_RE = re.compile(
+    rb"<(script|style|noscript)\b.*?(?:</\1\s*>|$)|<!--.*?(?:-->|$)|<[^>]*(?:>|$)",
+    re.I | re.S,
+)
+# Page chrome left out of the density sample (menus are often English on Telugu sites)
+CHROME_BYTES_RE = re.compile(rb"<(nav|header|footer|aside)\b.*?(?:</\1\s*>|$)", re.I | re.S)
+# One match per visible character: non-whitespace bytes that are not UTF-8 continuation bytes
+VISIBLE_CHAR_RE = re.compile(rb"[^\s\x80-\xbf]")
+# Entities count as one character: &nbsp; as a space, anything else as one byte
+NBSP_ENTITY_RE = re.compile(rb"&(?:nbsp|#160|#x0*a0);", re.I)
+ENTITY_RE = re.compile(rb"&[#\w]+;")
+BYTES_SPACE_RE = re.compile(rb"\s+")
+
+MAX_OUTPUT_LINES = 5000
+# Inputs at least this long are cleaned with filter_telugu_batch (numpy, ~3-5x faster), in chunks of this size
+BATCH_CHUNK_LINES = 8192
+
+# Head-only scan for <link rel="canonical"> / og:url (page-level dedup)
+HEAD_SCAN_BYTES = 64 * 1024
+HEAD_END_RE = re.compile(rb"</head\s*>|<body\b", re.I)
+HEAD_TAG_RE = re.compile(rb"<(link|meta)\b([^>]*)>", re.I)
+ATTR_RE = re.compile(rb"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+
+
+# Transient server answers and errors worth retrying (GET is idempotent)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ContentDecodingError,
+)
+# ConnectionError subclasses that retrying will not fix; like 4xx they skip retries and the breaker
+PERMANENT_ERRORS = (requests.exceptions.SSLError, requests.exceptions.ProxyError)
+BODY_CHUNK_BYTES = 64 * 1024
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), None if absent/invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class FetchSkipped(Exception):
+    """A fetch was not attempted: time budget spent or host circuit open."""
+
+
+class FetchPolicy:
+    """Timeouts, time budgets, retries, hedging and per-host circuit breaking for GETs.
+
+    One instance is shared by a whole crawl so budgets, latency samples and
+    breaker state carry across pages.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        total_timeout: float = 30.0,
+        crawl_budget: Optional[float] = None,
+        host_budget: Optional[float] = None,
+        retries: int = 2,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 8.0,
+        max_retry_after: float = 30.0,
+        hedge: bool = False,
+        hedge_min_delay: float = 1.0,
+        breaker_threshold: int = 3,
+        breaker_cooldown: float = 60.0,
+    ):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self.crawl_budget = crawl_budget
+        self.host_budget = host_budget
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_retry_after = max_retry_after
+        self.hedge = hedge
+        self.hedge_min_delay = hedge_min_delay
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+
+        self.started = time.monotonic()
+        self.host_spent: dict[str, float] = defaultdict(float)
+        self.host_failures: dict[str, int] = defaultdict(int)
+        self.host_open_until: dict[str, float] = {}
+        self.latencies: deque[float] = deque(maxlen=200)
+        self.pool: Optional[ThreadPoolExecutor] = None
+        self.closed = threading.Event()
+
+    def remaining(self, host: str) -> Optional[float]:
+        """Seconds left for this host (the tighter of crawl and host budget), None if unbounded."""
+        left = []
+        if self.crawl_budget is not None:
+            left.append(self.crawl_budget - (time.monotonic() - self.started))
+        if self.host_budget is not None:
+            left.append(self.host_budget - self.host_spent[host])
+        return min(left) if left else None
+
+    def crawl_exhausted(self) -> bool:
+        return self.crawl_budget is not None and time.monotonic() - self.started >= self.crawl_budget
+
+    def hedge_delay(self) -> float:
+        """p95 of recent successful latencies (needs 20 samples), never below hedge_min_delay."""
+        if len(self.latencies) < 20:
+            return self.hedge_min_delay
+        ordered = sorted(self.latencies)
+        return max(self.hedge_min_delay, ordered[int(0.95 * (len(ordered) - 1))])
+
+    def get(self, url: str) -> requests.Response:
+        host = urlparse(url).netloc.lower()
+        open_until = self.host_open_until.get(host)
+        if open_until is not None and time.monotonic() < open_until:
+            raise FetchSkipped(f"circuit open for {host} ({open_until - time.monotonic():.0f}s left)")
+
+        t0 = time.monotonic()
+        left = self.remaining(host)
+        deadline = None if left is None else t0 + left
+        try:
+            resp = self._get_with_retries(url, host, deadline)
+        except (FetchSkipped, *PERMANENT_ERRORS):
+            raise
+        except requests.HTTPError as e:
+            # 4xx means the host is up; only server-side failures count toward the breaker
+            if e.response is not None and e.response.status_code in RETRY_STATUSES:
+                self._record_failure(host)
+            raise
+        except requests.RequestException:
+            self._record_failure(host)
+            raise
+        finally:
+            self.host_spent[host] += time.monotonic() - t0
+        self.host_failures[host] = 0
+        self.host_open_until.pop(host, None)
+        return resp
+
+    def close(self) -> None:
+        """Shut down the hedge pool; requests still reading stop at their next chunk."""
+        self.closed.set()
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    def _record_failure(self, host: str) -> None:
+        self.host_failures[host] += 1
+        if self.host_failures[host] >= self.breaker_threshold:
+            self.host_open_until[host] = time.monotonic() + self.breaker_cooldown
+
+    def _get_with_retries(self, url: str, host: str, deadline: Optional[float]) -> requests.Response:
+        """deadline is the monotonic time at which the crawl/host budget runs out (None: unbounded)."""
+        attempt = 0
+        while True:
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                raise FetchSkipped(f"time budget spent for {host}")
+            # Wall-clock cap for this attempt, headers and body included
+            attempt_deadline = now + self.total_timeout
+            if deadline is not None:
+                attempt_deadline = min(attempt_deadline, deadline)
+            left = attempt_deadline - now
+            timeout = (min(self.connect_timeout, left), min(self.read_timeout, left))
+            try:
+                if self.hedge:
+                    resp = self._hedged(url, timeout, attempt_deadline)
+                else:
+                    resp = self._send(url, timeout, attempt_deadline)
+                if resp.status_code in RETRY_STATUSES and attempt < self.retries:
+                    resp.close()
+                    raise requests.HTTPError(f"{resp.status_code} for {url}", response=resp)
+                resp.raise_for_status()
+                return resp
+            except PERMANENT_ERRORS:
+                raise
+            except (*RETRY_ERRORS, requests.HTTPError) as e:
+                status = e.response.status_code if isinstance(e, requests.HTTPError) and e.response is not None else None
+                if isinstance(e, requests.HTTPError) and status not in RETRY_STATUSES:
+                    raise
+                if attempt >= self.retries:
+                    raise
+                # Exponential backoff with full jitter, or the server's Retry-After when given
+                delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+                if status in (429, 503):
+                    retry_after = parse_retry_after(e.response.headers.get("Retry-After"))
+                    if retry_after is not None:
+                        if retry_after > self.max_retry_after:
+                            raise
+                        delay = retry_after
+                # Never sleep past the budget
+                if deadline is not None and time.monotonic() + delay >= deadline:
+                    raise
+                print(f"[retry] {url}: {e} (retrying in {delay:.1f}s)", file=sys.stderr)
+                time.sleep(delay)
+                attempt += 1
+
+    def _send(
+        self,
+        url: str,
+        timeout: tuple[float, float],
+        deadline: float,
+        cancelled: Optional[threading.Event] = None,
+    ) -> requests.Response:
+        """GET with the body read here, so a server dripping bytes cannot outlast deadline.
+
+        requests' read timeout only bounds the gap between bytes, not the whole download.
+        """
+        t0 = time.monotonic()
+        resp = requests.get(url, headers=HEADERS, timeout=timeout, stream=True)
+        chunks: list[bytes] = []
+        try:
+            while True:
+                if cancelled is not None and cancelled.is_set():
+                    raise requests.ConnectionError(f"hedged duplicate of {url} no longer needed")
+                if self.closed.is_set():
+                    raise requests.ConnectionError(f"fetch policy closed while reading {url}")
+                if time.monotonic() >= deadline:
+                    raise requests.Timeout(f"{url} took longer than its deadline")
+                # read1 returns whatever has arrived instead of waiting for a full chunk (urllib3 >= 2.2)
+                chunk = resp.raw.read1(BODY_CHUNK_BYTES, decode_content=True)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        # Same translation requests applies in iter_content
+        except urllib3.exceptions.ProtocolError as e:
+            raise requests.exceptions.ChunkedEncodingError(e)
+        except urllib3.exceptions.DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e)
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise requests.ReadTimeout(e)
+        except urllib3.exceptions.SSLError as e:
+            raise requests.exceptions.SSLError(e)
+        finally:
+            resp.close()
+        resp._content = b"".join(chunks)
+        resp._content_consumed = True
+        if resp.status_code < 500:
+            self.latencies.append(time.monotonic() - t0)
+        return resp
+
+    def _hedged(self, url: str, timeout: tuple[float, float], deadline: float) -> requests.Response:
+        """Send a second identical GET if the first is slower than hedge_delay; first to finish wins."""
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="fetch")
+        cancelled = threading.Event()
+        pending = {self.pool.submit(self._send, url, timeout, deadline, cancelled)}
+        done, _ = wait(pending, timeout=min(self.hedge_delay(), max(0.0, deadline - time.monotonic())))
+        if not done and time.monotonic() < deadline:
+            pending.add(self.pool.submit(self._send, url, timeout, deadline, cancelled))
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                if fut.exception() is not None:
+                    error = fut.exception()
+                    continue
+                # The slower copy stops at its next chunk
+                cancelled.set()
+                return fut.result()
+        raise error
+
+
+def fetch_response(url: str, policy: Optional[FetchPolicy] = None) -> requests.Response:
+    return (policy or FetchPolicy()).get(url)
+
+
+def fetch(url: str, policy: Optional[FetchPolicy] = None) -> str:
+    resp = fetch_response(url, policy)
     resp.encoding = resp.encoding or "utf-8"
     return resp.text
 
@@ -618,65 +919,339 @@ def extract_paragraphs(html: str) -> list[str]:
     return texts
 
 
+def visible_content(raw: bytes, limit: Optional[int] = None) -> bytes:
+    """Visible text bytes from the first <article> (else <body>) on, without nav/header/footer/aside.
+
+    limit caps how many raw bytes are looked at. No decoding or parsing.
+    """
+    start = 0
+    for start_re in CONTENT_START_RES:
+        m = start_re.search(raw)
+        if m:
+            start = m.start()
+            break
+    region = raw[start:] if limit is None else raw[start:start + limit]
+    return INVISIBLE_BYTES_RE.sub(b" ", CHROME_BYTES_RE.sub(b" ", region))
+
+
+def telugu_density(raw: bytes, sample_size: int = PRESCREEN_SAMPLE_BYTES) -> tuple[float, int]:
+    """Share of visible content characters that are Telugu.
+
+    Samples sample_size bytes of visible_content. Returns (density, visible_chars).
+    """
+    visible = visible_content(raw, sample_size)
+    visible = ENTITY_RE.sub(b"&", NBSP_ENTITY_RE.sub(b" ", visible))
+    total = len(VISIBLE_CHAR_RE.findall(visible))
+    if not total:
+        return 0.0, 0
+    return len(TELUGU_UTF8_RE.findall(visible)) / total, total
+
+
+def prescreen_skip_reason(resp: requests.Response, min_density: float) -> Optional[str]:
+    """Reason to skip a fetched page before parsing, or None to keep it."""
+    if min_density <= 0:
+        return None
+    # Byte counting only makes sense for UTF-8 (or undeclared) bodies
+    enc = (resp.encoding or "utf-8").lower().replace("_", "-")
+    if enc not in ("utf-8", "utf8", "iso-8859-1"):
+        return None
+    density, visible = telugu_density(resp.content)
+    if visible < PRESCREEN_MIN_VISIBLE_CHARS:
+        return f"near-empty ({visible} visible chars in article/body sample)"
+    if density < min_density:
+        return f"Telugu density {density:.2f} < {min_density:.2f} ({visible} visible chars sampled)"
+    return None
+
+
+def normalize_url(url: str) -> str:
+    return urldefrag(url.strip())[0]
+
+
+def head_canonical_urls(raw: bytes, base_url: str) -> list[str]:
+    """<link rel="canonical"> and og:url targets, read from the <head> bytes only."""
+    head = raw[:HEAD_SCAN_BYTES]
+    m = HEAD_END_RE.search(head)
+    if m:
+        head = head[:m.start()]
+    urls: list[str] = []
+    for tag in HEAD_TAG_RE.finditer(head):
+        attrs = {
+            k.lower(): (a or b or c)
+            for k, a, b, c in ATTR_RE.findall(tag.group(2))
+        }
+        if tag.group(1).lower() == b"link":
+            if b"canonical" not in attrs.get(b"rel", b"").lower().split():
+                continue
+            target = attrs.get(b"href")
+        else:
+            if (attrs.get(b"property") or attrs.get(b"name") or b"").lower() != b"og:url":
+                continue
+            target = attrs.get(b"content")
+        if target:
+            text = htmllib.unescape(target.decode("utf-8", "replace"))
+            urls.append(normalize_url(urljoin(base_url, text)))
+    return urls
+
+
+def body_fingerprint(raw: bytes) -> Optional[str]:
+    """Hash of the article/body text (visible_content), so AMP, print, mobile and mirrored
+    copies with different markup and page furniture collide.
+
+    None for pages without visible text, which would otherwise all share one hash.
+    """
+    visible = BYTES_SPACE_RE.sub(b" ", visible_content(raw)).strip()
+    if not visible:
+        return None
+    return "sha1:" + hashlib.sha1(visible).hexdigest()
+
+
+def page_url_keys(url: str, resp: requests.Response) -> list[str]:
+    keys = [normalize_url(url), normalize_url(resp.url or url)]
+    keys.extend(head_canonical_urls(resp.content, resp.url or url))
+    return list(OrderedDict.fromkeys(keys))
+
+
+def check_duplicate(
+    url: str,
+    resp: requests.Response,
+    seen: set[str],
+    added: Optional[list[str]] = None,
+) -> Optional[str]:
+    """Record a page's keys; return the key it was already seen under, if any.
+
+    Keys of duplicates are recorded too, so their URLs are skipped before fetching next time.
+    Keys new to seen are also appended to added.
+    """
+    keys = page_url_keys(url, resp)
+    fingerprint = body_fingerprint(resp.content)
+    if fingerprint:
+        keys.append(fingerprint)
+    dup = next((key for key in keys if key in seen), None)
+    if added is not None:
+        added.extend(key for key in keys if key not in seen)
+    seen.update(keys)
+    return dup
+
+
+def load_seen_index(path: str) -> set[str]:
+    if not os.path.exists(path):
+        return set()
+    with open(path, encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+
+def save_seen_index(path: str, seen: set[str]) -> None:
+    # Write a temp file and swap it in, so an interrupted save keeps the old index
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for key in sorted(seen):
+            f.write(key + "\n")
+    os.replace(tmp_path, path)
+
+
 def clean_line(line: str) -> str:
     line = CLEAN_RE.sub(" ", line)
     line = MULTISPACE_RE.sub(" ", line).strip()
     return line
 
 
+JUNK_PATTERNS = [
+    re.compile(r"డౌన్\s*లోడ్", re.I),
+    re.compile(r"డౌన్‌లోడ్", re.I),
+    re.compile(r"ఇక్కడ\s*చూడండి", re.I),
+    re.compile(r"క్లిక్", re.I),
+    re.compile(r"click", re.I),
+    re.compile(r"pdf", re.I),
+]
+TELUGU_CHAR_RE = re.compile(fr"[{TELUGU_RANGE}]")
+ADDRESS_RE = re.compile(r"\b\d{1,4}(?:[-\/]\d{1,4}){1,4}\b(?:[^\n]*?\b\d{3}\s?-?\s?\d{3}\b)?")
+IMPORTANT_NOTE_RE = re.compile(r"(పరీక్ష|సూచనలు|ప్రకటన|అధికారిక|హెచ్చరిక|జాగ్రత్త|notice|guidelines)", re.I)
+
+
+def wrap_addresses(t: str) -> str:
+    return ADDRESS_RE.sub(lambda m: f"[ADDRESS] {m.group(0)} [/ADDRESS]", t)
+
+
+def mostly_english(t: str) -> bool:
+    letters = len(re.sub(r"[^A-Za-z]", "", t))
+    return (letters > 0) and (letters / max(len(t), 1) > 0.6)
+
+
+def is_date_or_number(t: str) -> bool:
+    if re.fullmatch(r"\d{1,4}", t):
+        return True
+    if re.fullmatch(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}", t):
+        return True
+    if re.fullmatch(r"\d{4}[/-]\d{1,2}[/-]\d{1,2}", t):
+        return True
+    return False
+
+
+def prepare_line(raw: str) -> str:
+    cl = clean_line(raw)
+    if not cl:
+        return ""
+    cl = ui_words_re.sub("", cl)
+    return MULTISPACE_RE.sub(" ", cl).strip()
+
+
+def accept_line(cl: str) -> Optional[str]:
+    """Apply the per-line rules to a prepared line; return the kept form or None."""
+    if any(p.search(cl) for p in JUNK_PATTERNS):
+        return None
+    if re.match(r"^గమనిక[\s:,-]", cl):
+        if not IMPORTANT_NOTE_RE.search(cl):
+            return None
+    cl = wrap_addresses(cl)
+    if mostly_english(cl) and "[ADDRESS]" not in cl:
+        return None
+    if (len(cl) >= 10 and TELUGU_CHAR_RE.search(cl)) or (len(cl) < 10 and is_date_or_number(cl)):
+        return cl
+    return None
+
+
 def filter_telugu(lines: list[str]) -> list[str]:
-    out: list[str] = []
     seen = OrderedDict()
-    telugu_char = re.compile(fr"[{TELUGU_RANGE}]")
-    junk_patterns = [
-        re.compile(r"డౌన్\s*లోడ్", re.I),
-        re.compile(r"డౌన్‌లోడ్", re.I),
-        re.compile(r"ఇక్కడ\s*చూడండి", re.I),
-        re.compile(r"క్లిక్", re.I),
-        re.compile(r"click", re.I),
-        re.compile(r"pdf", re.I),
-    ]
-    address_re = re.compile(r"\b\d{1,4}(?:[-\/]\d{1,4}){1,4}\b(?:[^\n]*?\b\d{3}\s?-?\s?\d{3}\b)?")
-    important_note_re = re.compile(r"(పరీక్ష|సూచనలు|ప్రకటన|అధికారిక|హెచ్చరిక|జాగ్రత్త|notice|guidelines)", re.I)
-
-    def wrap_addresses(t: str) -> str:
-        return address_re.sub(lambda m: f"[ADDRESS] {m.group(0)} [/ADDRESS]", t)
-
-    def mostly_english(t: str) -> bool:
-        letters = len(re.sub(r"[^A-Za-z]", "", t))
-        return (letters > 0) and (letters / max(len(t), 1) > 0.6)
-
-    def is_date_or_number(t: str) -> bool:
-        if re.fullmatch(r"\d{1,4}", t):
-            return True
-        if re.fullmatch(r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}", t):
-            return True
-        if re.fullmatch(r"\d{4}[/-]\d{1,2}[/-]\d{1,2}", t):
-            return True
-        return False
-
     for raw in lines:
-        cl = clean_line(raw)
-        if not cl:
-            continue
-        cl = ui_words_re.sub("", cl)
-        cl = MULTISPACE_RE.sub(" ", cl).strip()
+        cl = prepare_line(raw)
         if not cl:
             continue
-        if any(p.search(cl) for p in junk_patterns):
-            continue
-        if re.match(r"^గమనిక[\s:,-]", cl):
-            if not important_note_re.search(cl):
-                continue
-        cl = wrap_addresses(cl)
-        if mostly_english(cl) and "[ADDRESS]" not in cl:
-            continue
-        if (len(cl) >= 10 and telugu_char.search(cl)) or (len(cl) < 10 and is_date_or_number(cl)):
-            if cl not in seen:
-                seen[cl] = True
+        cl = accept_line(cl)
+        if cl and cl not in seen:
+            seen[cl] = True
     return list(seen.keys())
 
 
+# Batch scoring (filter_telugu_batch). After CLEAN_RE only ASCII letters have case,
+# so str.lower() keeps character positions and plain substring search can find the
+# few lines the UI/junk/note regexes could touch.
+UI_WORD_NEEDLES = ("click", "download", "pdf", "live")
+JUNK_NEEDLES = ("డౌన్", "ఇక్కడ", "క్లిక్", "click", "pdf")
+NOTE_NEEDLE = "గమనిక"
+# Character classes for score_chunk, indexed by code point (anything >= U+0C80 is "other")
+CLS_OTHER, CLS_TELUGU, CLS_TELUGU_DIGIT, CLS_DIGIT, CLS_LETTER, CLS_SEP, CLS_NEWLINE = range(7)
+N_CLASSES = 8
+
+
+def build_class_table():
+    table = np.zeros(0x0C81, dtype=np.uint8)
+    table[0x0C00:0x0C80] = CLS_TELUGU
+    table[0x0C66:0x0C70] = CLS_TELUGU_DIGIT
+    table[ord("0"):ord("9") + 1] = CLS_DIGIT
+    table[ord("A"):ord("Z") + 1] = CLS_LETTER
+    table[ord("a"):ord("z") + 1] = CLS_LETTER
+    table[[ord("/"), ord("-")]] = CLS_SEP
+    table[ord("\n")] = CLS_NEWLINE
+    return table
+
+
+CLASS_TABLE = build_class_table() if np is not None else None
+
+
+def lines_containing(low: str, starts: list[int], needles) -> set[int]:
+    """Indices of the "\n"-joined lines (starting at offsets starts) that contain any needle."""
+    found = set()
+    for needle in needles:
+        i = low.find(needle)
+        while i != -1:
+            found.add(bisect_right(starts, i) - 1)
+            i = low.find(needle, i + 1)
+    return found
+
+
+def line_starts(lines: list[str]) -> list[int]:
+    return [0, *accumulate(len(line) + 1 for line in lines[:-1])]
+
+
+def prepare_chunk(lines: list[str]) -> list[str]:
+    """prepare_line for a whole chunk; CLEAN_RE runs once over the joined chunk."""
+    joined = "\n".join(lines)
+    if joined.count("\n") != len(lines) - 1:
+        # A newline inside a line is whitespace to clean_line, the same as a space
+        joined = "\n".join(line.replace("\n", " ") for line in lines)
+    # str.split() and \s use the same whitespace definition
+    prepared = [" ".join(line.split()) for line in CLEAN_RE.sub(" ", joined).split("\n")]
+    low = "\n".join(prepared).lower()
+    for i in lines_containing(low, line_starts(prepared), UI_WORD_NEEDLES):
+        prepared[i] = MULTISPACE_RE.sub(" ", ui_words_re.sub("", prepared[i])).strip()
+    return prepared
+
+
+def score_chunk(prepared: list[str]):
+    """Per-line verdicts for prepared lines: 0 reject, 1 keep as is, 2 run accept_line.
+
+    All lines are packed into one code-point array and classified through
+    CLASS_TABLE; a single bincount gives per-line length and Telugu, digit and
+    ASCII-letter counts. A line without a digit directly followed by "-" or "/"
+    can never match ADDRESS_RE, so it is not rewritten and the length, Telugu and
+    mostly_english rules are decided from the counts. Only possible addresses go
+    back through accept_line; junk/note regexes run only on lines that contain
+    their literal text.
+    """
+    n = len(prepared)
+    text = "\n".join(prepared)
+    cps = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    cls = CLASS_TABLE[np.minimum(cps, len(CLASS_TABLE) - 1)]
+    lengths = np.fromiter(map(len, prepared), dtype=np.int64, count=n)
+    line_id = np.repeat(np.arange(n), lengths + 1)[:len(cps)]
+    counts = np.bincount(line_id * N_CLASSES + cls, minlength=n * N_CLASSES).reshape(n, N_CLASSES)
+    telugu = counts[:, CLS_TELUGU] + counts[:, CLS_TELUGU_DIGIT]
+    # \d in the rules also matches Telugu digits
+    digits = counts[:, CLS_DIGIT] + counts[:, CLS_TELUGU_DIGIT]
+    letters = counts[:, CLS_LETTER]
+
+    # The "\n" between lines is not a separator, so no pair straddles two lines
+    is_digit = (cls == CLS_DIGIT) | (cls == CLS_TELUGU_DIGIT)
+    pair_at = np.flatnonzero(is_digit[:-1] & (cls[1:] == CLS_SEP))
+    maybe_address = np.bincount(line_id[pair_at], minlength=n) > 0
+
+    english = (letters > 0) & (letters / np.maximum(lengths, 1) > 0.6)
+    keep = ~english & (
+        ((telugu > 0) & (lengths >= 10))
+        # is_date_or_number without a separator: \d{1,4}
+        | ((lengths >= 1) & (lengths <= 4) & (digits == lengths))
+    )
+    verdict = np.where(maybe_address, 2, np.where(keep, 1, 0))
+    verdict[lengths == 0] = 0
+
+    low = text.lower()
+    starts = line_starts(prepared)
+    for i in lines_containing(low, starts, JUNK_NEEDLES):
+        if any(p.search(prepared[i]) for p in JUNK_PATTERNS):
+            verdict[i] = 0
+    for i in lines_containing(text, starts, (NOTE_NEEDLE,)):
+        cl = prepared[i]
+        if re.match(r"^గమనిక[\s:,-]", cl) and not IMPORTANT_NOTE_RE.search(cl):
+            verdict[i] = 0
+    return verdict
+
+
+def filter_telugu_batch(lines: list[str], chunk_size: int = BATCH_CHUNK_LINES) -> list[str]:
+    """Same output as filter_telugu, with cleaning and rule checks done per chunk (needs numpy)."""
+    if np is None:
+        raise RuntimeError("filter_telugu_batch needs numpy (pip install numpy)")
+    seen: set[str] = set()
+    out: list[str] = []
+    for i in range(0, len(lines), chunk_size):
+        out.extend(filter_chunk(lines[i:i + chunk_size], seen))
+    return out
+
+
+def filter_chunk(chunk: list[str], seen: set[str]) -> list[str]:
+    """Kept lines of one chunk that are not in seen yet (seen is updated)."""
+    prepared = prepare_chunk(chunk)
+    verdict = score_chunk(prepared).tolist()
+    out: list[str] = []
+    for j, v in enumerate(verdict):
+        if not v:
+            continue
+        cl = prepared[j] if v == 1 else accept_line(prepared[j])
+        if cl and cl not in seen:
+            seen.add(cl)
+            out.append(cl)
+    return out
+
+
 def apply_post_rules(cleaned_lines: list[str]) -> list[str]:
     side_story_terms = ["బర్త్ డే", "థాయిలాండ్", "సింధు", "దర్శకులతో"]
     kept: list[str] = []
@@ -693,6 +1268,84 @@ def apply_post_rules(cleaned_lines: list[str]) -> list[str]:
     return kept
 
 
+def is_same_domain(seed: str, candidate: str) -> bool:
+    a, b = urlparse(seed), urlparse(candidate)
+    return a.netloc.lower() == b.netloc.lower()
+
+
+def collect_links(seed_url: str, html: str, limit: int = 20) -> list[str]:
+    soup = BeautifulSoup(html, "html.parser")
+    found: list[str] = []
+    seen = set()
+    for a in soup.find_all("a", href=True):
+        full = urljoin(seed_url, a["href"].strip())
+        if full in seen:
+            continue
+        seen.add(full)
+        if not is_same_domain(seed_url, full):
+            continue
+        found.append(full)
+        if len(found) >= limit:
+            break
+    return found
+
+
+def scrape_url(
+    url: str,
+    min_density: float = DEFAULT_MIN_TELUGU_DENSITY,
+    seen: Optional[set[str]] = None,
+    policy: Optional[FetchPolicy] = None,
+    added: Optional[list[str]] = None,
+) -> list[str]:
+    if seen is not None and normalize_url(url) in seen:
+        print(f"[skip] {url}: already processed", file=sys.stderr)
+        return []
+    try:
+        resp = fetch_response(url, policy)
+    except FetchSkipped as e:
+        print(f"[skip] {url}: {e}", file=sys.stderr)
+        return []
+    except Exception as e:
+        print(f"[warn] Failed to fetch {url}: {e}", file=sys.stderr)
+        return []
+    reason = prescreen_skip_reason(resp, min_density)
+    if reason:
+        print(f"[skip] {url}: {reason}", file=sys.stderr)
+        return []
+    if seen is not None:
+        dup = check_duplicate(url, resp, seen, added)
+        if dup:
+            print(f"[skip] {url}: duplicate of {dup}", file=sys.stderr)
+            return []
+    resp.encoding = resp.encoding or "utf-8"
+    return extract_paragraphs(resp.text)
+
+
+def clean_paragraphs(paras: list[str]) -> list[str]:
+    if np is not None and len(paras) >= BATCH_CHUNK_LINES:
+        cleaned_lines = filter_telugu_batch(paras)
+    else:
+        cleaned_lines = filter_telugu(paras)
+    return apply_post_rules(cleaned_lines)
+
+
+def written_page_count(all_paras: list[str], page_ends: list[int], max_lines: int) -> int:
+    """How many leading pages had all their lines written when output was cut to max_lines.
+
+    Cleaning keeps order and first occurrences, so cleaning a prefix of the
+    paragraphs yields a prefix of the full output; page k is complete iff the
+    paragraphs up to page_ends[k] clean to at most max_lines lines.
+    """
+    lo, hi = 0, len(page_ends)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if len(clean_paragraphs(all_paras[:page_ends[mid - 1]])) <= max_lines:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
 def next_output_path(base_dir: str = ".") -> str:
     existing = [f for f in os.listdir(base_dir) if f.startswith("raw_telugu_") and f.endswith(".txt")]
     nums = []
@@ -706,24 +1359,131 @@ def next_output_path(base_dir: str = ".") -> str:
     return os.path.join(base_dir, f"raw_telugu_{n}.txt")
 
 
+def crawl(args, policy: FetchPolicy, seen: set[str]) -> tuple[list[str], list[tuple[list[str], int]]]:
+    """Fetch the seed (and followed links); return paragraphs plus, per page, the keys
+    it added to seen and the paragraph count after it.
+
+    A page's keys only go into --seen-index once its lines are in the output file.
+    """
+    try:
+        resp = fetch_response(args.url, policy)
+    except Exception as e:
+        print(f"[error] Failed to fetch: {e}", file=sys.stderr)
+        sys.exit(1)
+    resp.encoding = resp.encoding or "utf-8"
+    html = resp.text
+
+    all_paras: list[str] = []
+    pages: list[tuple[list[str], int]] = []
+    # The seed is usually a section page whose content changes, so it is matched
+    # only by body fingerprint; its URLs catch followed copies in this run but are not saved
+    seen.update(page_url_keys(args.url, resp))
+    fingerprint = body_fingerprint(resp.content)
+    if fingerprint and fingerprint in seen:
+        print(f"[skip] {args.url}: duplicate of {fingerprint}", file=sys.stderr)
+    else:
+        all_paras.extend(extract_paragraphs(html))
+        if fingerprint:
+            seen.add(fingerprint)
+            pages.append(([fingerprint], len(all_paras)))
+    if args.follow:
+        links = collect_links(args.url, html, limit=args.limit)
+        for i, link in enumerate(links, 1):
+            if policy.crawl_exhausted():
+                print(f"[info] Crawl budget spent; skipping remaining {len(links) - i + 1} links", file=sys.stderr)
+                break
+            print(f"[info] ({i}/{len(links)}) Following: {link}")
+            added: list[str] = []
+            all_paras.extend(scrape_url(link, args.min_telugu_density, seen, policy, added))
+            pages.append((added, len(all_paras)))
+    return all_paras, pages
+
+
+def reclean_file(in_path: str) -> str:
+    """Re-run the line filter over an existing text file (one line per paragraph) with the batch path.
+
+    The file is streamed in BATCH_CHUNK_LINES slices; only the cross-chunk dedup set stays in memory.
+    """
+    if np is None:
+        raise RuntimeError("--reclean needs numpy (pip install numpy)")
+    root, _ = os.path.splitext(in_path)
+    out_path = f"{root}.clean.txt"
+    seen: set[str] = set()
+    total = 0
+    with open(in_path, encoding="utf-8") as src, open(out_path, "w", encoding="utf-8") as dst:
+        while True:
+            chunk = [line.rstrip("\n") for line in islice(src, BATCH_CHUNK_LINES)]
+            if not chunk:
+                break
+            total += len(chunk)
+            for line in filter_chunk(chunk, seen):
+                dst.write(line + "\n")
+    print(f"Saved {len(seen)} of {total} lines to {out_path}")
+    return out_path
+
+
 def main():
     parser = argparse.ArgumentParser(description="General Telugu text scraper")
-    parser.add_argument("url", help="Seed/page URL to scrape")
+    parser.add_argument("url", nargs="?", help="Seed/page URL to scrape")
+    parser.add_argument(
+        "--reclean",
+        metavar="FILE",
+        help="Instead of scraping, re-clean an existing text file line by line (needs numpy); writes FILE.clean.txt",
+    )
     parser.add_argument("--follow", action="store_true", help="Also follow links from same domain")
     parser.add_argument("--limit", type=int, default=20, help="Max pages to follow")
+    parser.add_argument(
+        "--min-telugu-density",
+        type=float,
+        default=DEFAULT_MIN_TELUGU_DENSITY,
+        help="Skip followed pages whose article/body text is near-empty or less Telugu than this, e.g. 0.05 (default 0: off)",
+    )
+    parser.add_argument(
+        "--seen-index",
+        help="File of canonical URLs / body hashes already processed; pages found there are skipped and new ones appended",
+    )
+    parser.add_argument("--connect-timeout", type=float, default=5.0, help="Seconds to establish a connection")
+    parser.add_argument("--read-timeout", type=float, default=15.0, help="Seconds to wait between response bytes")
+    parser.add_argument("--total-timeout", type=float, default=30.0, help="Wall-clock seconds for one request attempt")
+    parser.add_argument("--retries", type=int, default=2, help="Retries for resets, timeouts and 429/5xx")
+    parser.add_argument("--crawl-budget", type=float, help="Total seconds for the whole crawl")
+    parser.add_argument("--host-budget", type=float, help="Total seconds to spend fetching from one host")
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a duplicate request when one runs past the p95 latency; use whichever answers first",
+    )
     args = parser.parse_args()
 
-    try:
-        html = fetch(args.url)
-    except Exception as e:
-        print(f"[error] Failed to fetch: {e}", file=sys.stderr)
-        sys.exit(1)
+    if args.reclean:
+        try:
+            reclean_file(args.reclean)
+        except (OSError, RuntimeError) as e:
+            print(f"[error] Failed to re-clean: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    if not args.url:
+        parser.error("a URL is required unless --reclean is given")
+
+    seen = load_seen_index(args.seen_index) if args.seen_index else set()
+    policy = FetchPolicy(
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        total_timeout=args.total_timeout,
+        crawl_budget=args.crawl_budget,
+        host_budget=args.host_budget,
+        retries=args.retries,
+        hedge=args.hedge,
+    )
 
-    all_paras = extract_paragraphs(html)
-    cleaned_lines = filter_telugu(all_paras)
-    post_lines = apply_post_rules(cleaned_lines)
+    try:
+        all_paras, pages = crawl(args, policy, seen)
+    finally:
+        policy.close()
 
-    post_lines = post_lines[:5000]
+    post_lines = clean_paragraphs(all_paras)
+    truncated = len(post_lines) > MAX_OUTPUT_LINES
+    post_lines = post_lines[:MAX_OUTPUT_LINES]
     final_lines: list[str] = []
     if post_lines:
         final_lines.append(f"HEADLINE: {post_lines[0]}")
@@ -737,6 +1497,15 @@ def main():
 
     print(f"Saved {len(final_lines)} lines to {out_path}")
 
+    if args.seen_index:
+        written = len(pages)
+        if truncated:
+            written = written_page_count(all_paras, [end for _, end in pages], MAX_OUTPUT_LINES)
+            print(f"[info] Output cut at {MAX_OUTPUT_LINES} lines; {len(pages) - written} pages not recorded as processed")
+        index = load_seen_index(args.seen_index)
+        for keys, _ in pages[:written]:
+            index.update(keys)
+        save_seen_index(args.seen_index, index)
 
 if __name__ == "__main__":
     main()
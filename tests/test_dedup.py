@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from scraper import body_fingerprint  # noqa: E402
+
+ARTICLE = "<article><h1>భారీ వర్షాలు</h1><p>హైదరాబాద్ లో భారీ వర్షాలు కురిశాయి.</p><aside>{aside}</aside></article>"
+
+DESKTOP = (
+    "<html><head><title>భారీ వర్షాలు | Site</title><style>body{{margin:0}}</style></head><body>"
+    "<header><a href='/'>Home</a></header><nav><a>Politics</a><a>Sports</a></nav>"
+    + ARTICLE
+    + "<footer>Copyright 2025 Telugu Daily</footer></body></html>"
+)
+AMP = (
+    "<html amp><head><title>భారీ వర్షాలు - AMP</title><script async src='amp.js'></script></head><body>"
+    "<nav><a>Menu</a></nav>"
+    + ARTICLE
+    + "<footer>AMP footer</footer></body></html>"
+)
+
+
+def test_copies_with_different_page_furniture_share_a_fingerprint():
+    desktop = DESKTOP.format(aside="ట్రెండింగ్: ఒకటి").encode()
+    amp = AMP.format(aside="ట్రెండింగ్: రెండు").encode()
+    assert body_fingerprint(desktop) is not None
+    assert body_fingerprint(desktop) == body_fingerprint(amp)
+
+
+def test_different_articles_do_not_share_a_fingerprint():
+    other = DESKTOP.format(aside="").replace("హైదరాబాద్", "విజయవాడ").encode()
+    assert body_fingerprint(DESKTOP.format(aside="").encode()) != body_fingerprint(other)
+
+
+def test_pages_without_visible_text_have_no_fingerprint():
+    assert body_fingerprint(b"<html><body><script>x()</script><nav>Home</nav></body></html>") is None
@@ -0,0 +1,119 @@
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from scraper import FetchPolicy, FetchSkipped  # noqa: E402
+
+BODY = "<p>తెలుగు వార్తలు</p>".encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits: dict[str, int] = {}
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        n = self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        try:
+            if self.path == "/flaky":
+                self.reply(503 if n == 1 else 200, BODY if n > 1 else b"")
+            elif self.path == "/busy":
+                self.reply(429, headers={"Retry-After": "120"})
+            elif self.path == "/missing":
+                self.reply(404)
+            elif self.path == "/down":
+                self.reply(500)
+            elif self.path == "/drip":
+                self.send_response(200)
+                self.send_header("Content-Length", "50")
+                self.end_headers()
+                for _ in range(50):
+                    self.wfile.write(b"x")
+                    self.wfile.flush()
+                    time.sleep(0.1)
+            elif self.path == "/slow-first":
+                if n == 1:
+                    time.sleep(2)
+                self.reply(200, BODY)
+            else:
+                self.reply(200, BODY)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries_after_503(base_url):
+    resp = FetchPolicy(backoff_base=0.01).get(base_url + "/flaky")
+    assert resp.status_code == 200
+    assert resp.content == BODY
+    assert Handler.hits["/flaky"] == 2
+
+
+def test_gives_up_when_retry_after_exceeds_cap(base_url):
+    t0 = time.monotonic()
+    with pytest.raises(requests.HTTPError):
+        FetchPolicy(max_retry_after=1.0).get(base_url + "/busy")
+    assert time.monotonic() - t0 < 1.0
+    assert Handler.hits["/busy"] == 1
+
+
+def test_breaker_opens_after_three_failures_and_ignores_4xx(base_url):
+    policy = FetchPolicy(retries=0, breaker_threshold=3)
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            policy.get(base_url + "/missing")
+    assert policy.host_failures[base_url.split("//")[1]] == 0
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            policy.get(base_url + "/down")
+    with pytest.raises(FetchSkipped):
+        policy.get(base_url + "/down")
+    assert Handler.hits["/down"] == 3
+
+
+def test_slow_body_is_cut_off_at_deadline(base_url):
+    t0 = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        FetchPolicy(total_timeout=0.5, retries=0).get(base_url + "/drip")
+    assert time.monotonic() - t0 < 1.5
+
+
+def test_hedged_copy_wins(base_url):
+    policy = FetchPolicy(hedge=True, hedge_min_delay=0.1)
+    try:
+        t0 = time.monotonic()
+        resp = policy.get(base_url + "/slow-first")
+        elapsed = time.monotonic() - t0
+    finally:
+        policy.close()
+    assert resp.content == BODY
+    assert elapsed < 1.5
+    assert Handler.hits["/slow-first"] == 2
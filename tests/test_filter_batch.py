@@ -0,0 +1,56 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+pytest.importorskip("numpy")
+
+from scraper import filter_telugu, filter_telugu_batch  # noqa: E402
+
+# Pieces that exercise every rule: junk words, UI words, గమనిక notes, addresses,
+# dates, Telugu digits, odd whitespace and characters CLEAN_RE removes
+PIECES = list("అఆఇఈఉకఖగచజటడతదనపబమయరలవశసహ్ాిీుూెేొో౦౧౨౩") + list(
+    "abcXYZ0123456789/-  .,:;[]()#@₹—\t\n\r"
+) + [
+    "గమనిక ", "గమనిక", "click", "Click ", " live  updates", "live\nupdates", "pdf", "డౌన్‌లోడ్",
+    "డౌన్ \nలోడ్", "ఇక్కడ చూడండి", "సూచనలు", "notice", "26/08/2025", "500016", "50-17-64",
+    "\ud800", "😀", "०१", "\x85", "‌",
+]
+
+EXAMPLES = [
+    "హైదరాబాద్ లో భారీ వర్షాలు కురిశాయి.",
+    "Andhra Pradesh news live updates today",
+    "2024",
+    "26/08/2025",
+    "౨౩",
+    "చిరునామా: 50-17-64, విశాఖపట్నం 530 016",
+    "గమనిక: ఇది ప్రకటన మాత్రమే",
+    "గమనిక: ఇది ఒక సాధారణ వాక్యం మాత్రమే",
+    "వీడియో కోసం ఇక్కడ క్లిక్ చేయండి",
+    "PDF డౌన్‌లోడ్ చేసుకోండి",
+    "",
+    "   ",
+    "హైదరాబాద్ లో భారీ వర్షాలు కురిశాయి.",
+]
+
+
+def random_lines(seed: int, count: int) -> list[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(PIECES) for _ in range(rng.choice([0, 1, 2, 3, 4, 5, 8, 9, 10, 11, 15, 30, 80])))
+        for _ in range(count)
+    ]
+
+
+def test_batch_matches_scalar_on_examples():
+    assert filter_telugu_batch(EXAMPLES) == filter_telugu(EXAMPLES)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_batch_matches_scalar_on_random_lines(seed):
+    lines = random_lines(seed, 20000)
+    # Small chunks so lines are also compared across chunk boundaries
+    assert filter_telugu_batch(lines, chunk_size=777) == filter_telugu(lines)